@@ -1,5 +1,7 @@
 from random import choice
 
+from chess import Move
+
 
 class RandomIA:
     """IA très simple qui joue un coup légal aléatoire sur le plateau fourni."""
@@ -7,11 +9,10 @@ class RandomIA:
     def __init__(self, board):
         self.board = board
 
-    def coup(self) -> str:
-        """Retourne un coup légal aléatoire au format SAN pour python-chess."""
+    def coup(self) -> Move:
+        """Retourne un coup légal aléatoire (objet Move, à jouer avec board.push)."""
         moves = list(self.board.legal_moves)
         if not moves:
             # Normalement on ne devrait pas arriver ici car le plateau vérifie la fin de partie
             raise ValueError("Aucun coup légal disponible")
-        move = choice(moves)
-        return self.board.san(move)
+        return choice(moves)
@@ -1,6 +1,14 @@
 from chess import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
-from chess import WHITE
+from chess import Board, Move, WHITE, BB_ALL, BB_SQUARES, BB_A1, BB_H1, BB_A8, BB_H8
+from chess import popcount, scan_forward, shift_down, shift_up, shift_left, shift_right, between
+from chess import BB_PAWN_ATTACKS, BB_KNIGHT_ATTACKS, BB_DIAG_ATTACKS, BB_DIAG_MASKS
+from chess import BB_RANK_ATTACKS, BB_RANK_MASKS, BB_FILE_ATTACKS, BB_FILE_MASKS
+from chess.polyglot import POLYGLOT_RANDOM_ARRAY
 import random
+import weakref
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
 OPENING_BOOK = {
     # Blancs
     'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1': [
@@ -48,17 +56,11 @@ OPENING_BOOK = {
 }
 
 
-PIECE_VALUES = {
-    PAWN: 100,
-    KNIGHT: 320,
-    BISHOP: 330,
-    ROOK: 500,
-    QUEEN: 900,
-    KING: 20000,
-}
+# Indexé directement par type de pièce (PAWN=1 ... KING=6), l'index 0 est inutilisé
+PIECE_VALUES = (0, 100, 320, 330, 500, 900, 20000)
 
 # Tables de position pour les pions (bonus/malus selon la position)
-PAWN_TABLE_WHITE = [
+PAWN_TABLE_WHITE = array('i', [
     0,  0,  0,  0,  0,  0,  0,  0,
     5, 10, 10,-20,-20, 10, 10,  5,
     5, -5,-10,  0,  0,-10, -5,  5,
@@ -67,12 +69,12 @@ PAWN_TABLE_WHITE = [
     10, 10, 20, 30, 30, 20, 10, 10,
     50, 50, 50, 50, 50, 50, 50, 50,
     0,  0,  0,  0,  0,  0,  0,  0
-]
+])
 
-PAWN_TABLE_BLACK = [x for x in reversed(PAWN_TABLE_WHITE)]
+PAWN_TABLE_BLACK = array('i', reversed(PAWN_TABLE_WHITE))
 
 # Tables de position pour les cavaliers
-KNIGHT_TABLE = [
+KNIGHT_TABLE = array('i', [
     -50,-40,-30,-30,-30,-30,-40,-50,
     -40,-20,  0,  0,  0,  0,-20,-40,
     -30,  0, 10, 15, 15, 10,  0,-30,
@@ -81,160 +83,368 @@ KNIGHT_TABLE = [
     -30,  5, 10, 15, 15, 10,  5,-30,
     -40,-20,  0,  5,  5,  0,-20,-40,
     -50,-40,-30,-30,-30,-30,-40,-50
-]
+])
+
+KNIGHT_TABLE_BLACK = array('i', reversed(KNIGHT_TABLE))
+
+# Bitboards des colonnes et de leurs colonnes voisines
+FILE_BB = [0x0101010101010101 << file for file in range(8)]
+ADJACENT_FILES_BB = [(FILE_BB[file - 1] if file > 0 else 0) | (FILE_BB[file + 1] if file < 7 else 0)
+                     for file in range(8)]
+
+# Cases devant chaque pion (sa colonne et les voisines), par couleur : pion passé si
+# aucun pion adverse ne s'y trouve
+PASSED_PAWN_MASK = [[0] * 64 for _ in range(2)]
+for _square in range(64):
+    _rank = _square // 8
+    _span = FILE_BB[_square % 8] | ADJACENT_FILES_BB[_square % 8]
+    PASSED_PAWN_MASK[WHITE][_square] = _span & ~((1 << (8 * (_rank + 1))) - 1)
+    PASSED_PAWN_MASK[not WHITE][_square] = _span & ((1 << (8 * _rank)) - 1)
+
+# Cases centrales (bitboards)
+CENTER_MASK = sum(1 << square for square in (27, 28, 35, 36))  # d4, e4, d5, e5
+EXTENDED_CENTER_MASK = sum(1 << square for square in (18, 19, 20, 21, 26, 29, 34, 37, 42, 43, 44, 45))  # Centre étendu
+
+# Matériel + position par [couleur][type de pièce][case], signé du point de vue des blancs
+# (le roi n'est pas compté, comme dans l'évaluation matérielle)
+PSQT = [[[0] * 64 for _ in range(7)] for _ in range(2)]
+for _square in range(64):
+    for _piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN):
+        PSQT[WHITE][_piece_type][_square] = PIECE_VALUES[_piece_type]
+        PSQT[not WHITE][_piece_type][_square] = -PIECE_VALUES[_piece_type]
+    PSQT[WHITE][PAWN][_square] += PAWN_TABLE_WHITE[_square]
+    PSQT[not WHITE][PAWN][_square] -= PAWN_TABLE_BLACK[_square]
+    PSQT[WHITE][KNIGHT][_square] += KNIGHT_TABLE[_square]
+    PSQT[not WHITE][KNIGHT][_square] -= KNIGHT_TABLE_BLACK[_square]
+
+# Clés de Zobrist (table Polyglot précalculée, à plat) :
+# pièces en 64 * ((type - 1) * 2 + couleur) + case, puis roques, prise en passant et trait
+ZOBRIST = array('Q', POLYGLOT_RANDOM_ARRAY)
+ZOBRIST_CASTLING = ((BB_H1, 768), (BB_A1, 769), (BB_H8, 770), (BB_A8, 771))
+ZOBRIST_EP = 772
+ZOBRIST_TURN = 780
+
+
+def _zobrist_castling(castling_rights):
+    """Part des droits de roque dans la clé de Zobrist."""
+    key = 0
+    for mask, index in ZOBRIST_CASTLING:
+        if castling_rights & mask:
+            key ^= ZOBRIST[index]
+    return key
+
+
+def _zobrist_ep(board):
+    """Part de la prise en passant : seulement si un pion peut effectivement la jouer."""
+    if board.ep_square is None:
+        return 0
+    if board.turn == WHITE:
+        ep_mask = shift_down(BB_SQUARES[board.ep_square])
+    else:
+        ep_mask = shift_up(BB_SQUARES[board.ep_square])
+    if (shift_left(ep_mask) | shift_right(ep_mask)) & board.pawns & board.occupied_co[board.turn]:
+        return ZOBRIST[ZOBRIST_EP + (board.ep_square & 7)]
+    return 0
+
+
+def _repetition_key(board, key):
+    """Clé pour la détection des répétitions : une prise en passant illégale ne distingue pas deux positions."""
+    ep_key = _zobrist_ep(board)
+    if ep_key and not board.has_legal_en_passant():
+        return key ^ ep_key
+    return key
+
+
+def zobrist_hash(board):
+    """Clé de Zobrist complète de la position (compatible Polyglot)."""
+    key = 0
+    for piece_type, bb in enumerate((board.pawns, board.knights, board.bishops,
+                                     board.rooks, board.queens, board.kings)):
+        for color in (WHITE, not WHITE):
+            offset = 64 * (piece_type * 2 + color)
+            for square in scan_forward(bb & board.occupied_co[color]):
+                key ^= ZOBRIST[offset + square]
+    key ^= _zobrist_castling(board.castling_rights) ^ _zobrist_ep(board)
+    if board.turn == WHITE:
+        key ^= ZOBRIST[ZOBRIST_TURN]
+    return key
+
+
+# Livre d'ouvertures indexé par clé de Zobrist, coups déjà convertis en objets Move
+# (les entrées illégales sont écartées)
+_OPENING_BOOK_MOVES = {}
+for _fen, _sans in OPENING_BOOK.items():
+    _board = Board(_fen)
+    _moves = []
+    for _san in _sans:
+        try:
+            _moves.append(_board.parse_san(_san))
+        except ValueError:
+            pass
+    _OPENING_BOOK_MOVES[zobrist_hash(_board)] = _moves
+
+
+INF = 10**9  # Borne de la fenêtre alpha-bêta complète
+MAX_DEPTH = 64  # Profondeur maximale (en demi-coups) pour les tables par ply
+ASPIRATION_WINDOW = 50  # Demi-largeur de la fenêtre d'aspiration (centipions)
+DELTA_MARGIN = 200  # Marge de sécurité de l'élagage delta en quiescence (centipions)
+
+# Types d'entrées de la mémoire transposition
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT_SIZE = 1 << 19  # Nombre d'emplacements (puissance de 2)
+TT_MASK = TT_SIZE - 1
+# Chaque entrée occupe 2 mots de 64 bits : (clé ^ données, données), ce qui permet de
+# détecter une entrée déchirée quand plusieurs processus partagent la table.
+# Données : score (32 bits) | profondeur (8 bits) | borne (8 bits) | coup (16 bits)
+TT_BYTES = 16 * TT_SIZE
+TT_SCORE_OFFSET = 1 << 31
+
+# Cache d'évaluation : clé de Zobrist et score par emplacement (puissance de 2)
+EVAL_CACHE_SIZE = 1 << 16
+EVAL_CACHE_MASK = EVAL_CACHE_SIZE - 1
+
+
+def _tt_pack(depth, flag, score, move):
+    """Encode une entrée de la mémoire transposition dans un entier de 64 bits."""
+    move_code = 0
+    if move is not None:
+        move_code = move.from_square * 64 + move.to_square + ((move.promotion or 0) << 12)
+    return ((score + TT_SCORE_OFFSET) << 32) | (depth << 24) | (flag << 16) | move_code
+
+
+def _tt_move(move_code):
+    """Décode le coup d'une entrée de la mémoire transposition (None si absent)."""
+    if not move_code:
+        return None
+    return Move(move_code >> 6 & 63, move_code & 63, (move_code >> 12) or None)
+
+
+def _release_parallel(pool, shared_table):
+    """Arrête le pool de la recherche parallèle et libère sa mémoire partagée."""
+    pool.terminate()
+    pool.join()
+    shared_table.close()
+    shared_table.unlink()
+
+
+class _SearchStopped(Exception):
+    """Interrompt la recherche d'un processus auxiliaire quand le principal a terminé."""
 
 
 class TreeIA:
-    def __init__(self, depth=2):
+    def __init__(self, depth=2, workers=1):
         self.depth = depth
-        self.transposition_table = {}  # Mémoire transposition
+        self.workers = workers  # Nombre de processus pour la recherche à la racine
+        self.root_moves = None  # Ordre imposé des coups racine (processus auxiliaires)
+        # Mémoire transposition : tableau de taille fixe indexé par les bits bas de la clé,
+        # alloué à la première recherche (mémoire partagée dans la recherche parallèle)
+        self.transposition_table = None
+        # Recherche parallèle : pool de processus et mémoire partagée créés au premier
+        # coup puis réutilisés (libérés par close, ou automatiquement quand l'IA disparaît
+        # ou à la fin du programme) ; drapeau d'arrêt des auxiliaires
+        self._pool = None
+        self._shared_table = None
+        self._finalizer = None
+        self.stop_flag = None
+        # Cache des évaluations statiques, indexé comme la mémoire transposition
+        self._eval_keys = array('Q', bytes(8 * EVAL_CACHE_SIZE))
+        self._eval_scores = array('i', bytes(4 * EVAL_CACHE_SIZE))
         self.opening_moves_played = 0  # Compteur pour savoir quand quitter le livre
+        # Coups "killer" : 2 emplacements par ply, stockés en départ * 64 + arrivée
+        self.killers = array('h', [-1] * 2 * MAX_DEPTH)
+        # Heuristique d'historique : table plate indexée par départ * 64 + arrivée
+        self.history = array('q', bytes(8 * 64 * 64))
+        # Score matériel + positionnel incrémental (point de vue des blancs)
+        self._psqt = 0
+        self._white_material = 0  # Matériel blanc hors roi, pour la phase de jeu
+        self._zkey = 0  # Clé de Zobrist de la position courante
+        self._undo_stack = []
+        self._key_history = []
+
+    def _init_incremental(self):
+        """Recalcule entièrement les scores incrémentaux (début de recherche)."""
+        board = self.board
+        self._psqt = 0
+        self._white_material = 0
+        self._zkey = zobrist_hash(board)
+        # Parcours des bitboards par type de pièce (le roi n'a ni valeur ni table)
+        for piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN):
+            for color in (WHITE, not WHITE):
+                table = PSQT[color][piece_type]
+                for square in scan_forward(board.pieces_mask(piece_type, color)):
+                    self._psqt += table[square]
+            self._white_material += PIECE_VALUES[piece_type] * popcount(board.pieces_mask(piece_type, WHITE))
+        self._undo_stack = []
+        # Clés des positions de la partie depuis le dernier coup irréversible
+        self._key_history = []
+        board = self.board.copy()
+        for _ in range(min(board.halfmove_clock, len(board.move_stack))):
+            board.pop()
+            self._key_history.append(_repetition_key(board, zobrist_hash(board)))
+        self._key_history.reverse()
+
+    def _push(self, move):
+        """Joue un coup en mettant à jour les scores incrémentaux et la clé de Zobrist."""
+        board = self.board
+        self._undo_stack.append((self._psqt, self._white_material, self._zkey))
+        self._key_history.append(_repetition_key(board, self._zkey))
+        color = board.turn
+        from_square = move.from_square
+        to_square = move.to_square
+        piece_type = board.piece_type_at(from_square)
+        new_type = move.promotion or piece_type
+        table = PSQT[color]
+        delta = table[new_type][to_square] - table[piece_type][from_square]
+        zkey = (self._zkey ^ ZOBRIST[64 * ((piece_type - 1) * 2 + color) + from_square]
+                ^ ZOBRIST[64 * ((new_type - 1) * 2 + color) + to_square])
+        victim = board.piece_type_at(to_square)
+        if not victim and piece_type == PAWN and to_square == board.ep_square:
+            victim = PAWN
+            victim_square = to_square - 8 if color == WHITE else to_square + 8
+        else:
+            victim_square = to_square
+        if victim:
+            delta -= PSQT[not color][victim][victim_square]
+            zkey ^= ZOBRIST[64 * ((victim - 1) * 2 + (not color)) + victim_square]
+            if color != WHITE:
+                self._white_material -= PIECE_VALUES[victim]
+        if move.promotion and color == WHITE:
+            self._white_material += PIECE_VALUES[move.promotion] - PIECE_VALUES[PAWN]
+        if piece_type == KING and abs(to_square - from_square) == 2:
+            # Roque : la tour se déplace aussi (sans effet sur le score, pas de table pour la tour)
+            if to_square > from_square:
+                rook_from, rook_to = from_square + 3, from_square + 1
+            else:
+                rook_from, rook_to = from_square - 4, from_square - 1
+            rook_index = 64 * ((ROOK - 1) * 2 + color)
+            zkey ^= ZOBRIST[rook_index + rook_from] ^ ZOBRIST[rook_index + rook_to]
+        castling_rights = board.castling_rights
+        zkey ^= _zobrist_ep(board)
+        self._psqt += delta
+
+        board.push(move)
+
+        if board.castling_rights != castling_rights:
+            zkey ^= _zobrist_castling(castling_rights) ^ _zobrist_castling(board.castling_rights)
+        self._zkey = zkey ^ _zobrist_ep(board) ^ ZOBRIST[ZOBRIST_TURN]
+
+    def _pop(self):
+        """Annule le dernier coup joué par _push."""
+        self.board.pop()
+        self._psqt, self._white_material, self._zkey = self._undo_stack.pop()
+        self._key_history.pop()
+
+    def _is_repetition(self):
+        """Vrai si la position courante est déjà apparue (comparaison des clés de Zobrist)."""
+        keys = self._key_history
+        key = self._zkey
+        # Seules les positions du même trait depuis le dernier coup irréversible comptent
+        stop = max(len(keys) - self.board.halfmove_clock, 0) - 1
+        for i in range(len(keys) - 2, stop, -2):
+            if keys[i] == key:
+                return True
+        return False
 
     def evaluate(self) -> int:
-        """Évaluation avancée de la position."""
-        if self.board.is_checkmate():
-            return -100000 if self.board.turn == WHITE else 100000
-        if self.board.is_stalemate() or self.board.is_insufficient_material():
-            return 0
+        """Évaluation statique (les fins de partie sont détectées une seule fois par la recherche)."""
+        # 1) Matériel + tables de position (pions, cavaliers), tenus à jour par _push/_pop
+        score = self._psqt
 
-        score = 0
-        
-        # 1) Évaluation matérielle
-        for piece_type in [PAWN, KNIGHT, BISHOP, ROOK, QUEEN]:
-            white_pieces = len(self.board.pieces(piece_type, WHITE))
-            black_pieces = len(self.board.pieces(piece_type, not WHITE))
-            score += PIECE_VALUES[piece_type] * (white_pieces - black_pieces)
+        # 2) Pions, bitboards calculés une fois pour tous les termes de pions
+        board = self.board
+        white_pawns = board.pawns & board.occupied_co[WHITE]
+        black_pawns = board.pawns & board.occupied_co[not WHITE]
 
-        # 2) Évaluation positionnelle avancée
-        
-        # Pions - avec tables de position
-        for square in self.board.pieces(PAWN, WHITE):
-            score += PAWN_TABLE_WHITE[square]
+        # Pions passés (parcours direct des bitboards, sans SquareSet)
+        for square in scan_forward(white_pawns):
             # Bonus pour pions passés
-            if self._is_passed_pawn(square, WHITE):
+            if self._is_passed_pawn(square, WHITE, black_pawns):
                 score += 50 + (square // 8) * 10
                 
-        for square in self.board.pieces(PAWN, not WHITE):
-            score -= PAWN_TABLE_BLACK[square]
+        for square in scan_forward(black_pawns):
             # Malus pour pions passés adverses
-            if self._is_passed_pawn(square, not WHITE):
+            if self._is_passed_pawn(square, not WHITE, white_pawns):
                 score -= 50 + (7 - square // 8) * 10
 
         # Structure des pions
-        score += self._evaluate_pawn_structure()
-        
-        # 3) Évaluation des pièces avec tables de position
-        for square in self.board.pieces(KNIGHT, WHITE):
-            score += KNIGHT_TABLE[square]
-        for square in self.board.pieces(KNIGHT, not WHITE):
-            score -= KNIGHT_TABLE[63-square]  # Symétrie horizontale
+        score += self._evaluate_pawn_structure(white_pawns, black_pawns)
             
-        # 4) Contrôle du centre
+        # 3) Contrôle du centre
         score += self._evaluate_center_control()
         
-        # 5) Mobilité
-        white_mobility = len(list(self.board.legal_moves)) if self.board.turn == WHITE else 0
-        black_mobility = len(list(self.board.legal_moves)) if self.board.turn != WHITE else 0
-        score += 2 * (white_mobility - black_mobility)
+        # 4) Mobilité
+        score += 2 * self._mobility_score()
         
-        # 6) Sécurité du roi
+        # 5) Sécurité du roi
         score += self._evaluate_king_safety()
         
         return score
 
-    def _is_passed_pawn(self, square, color):
-        """Vérifie si un pion est passé."""
-        file = square % 8
-        # Vérifie s'il y a des pions adverses devant sur les files adjacentes
-        for check_file in [file-1, file, file+1]:
-            if 0 <= check_file <= 7:
-                if color == WHITE:
-                    # Pour les blancs, vérifie les rangées supérieures
-                    for rank in range(square // 8 + 1, 8):
-                        check_square = rank * 8 + check_file
-                        if self.board.piece_at(check_square) == PAWN and not self.board.color_at(check_square):
-                            return False
-                else:
-                    # Pour les noirs, vérifie les rangées inférieures
-                    for rank in range(square // 8 - 1, -1, -1):
-                        check_square = rank * 8 + check_file
-                        if self.board.piece_at(check_square) == PAWN and self.board.color_at(check_square):
-                            return False
-        return True
-
-    def _evaluate_pawn_structure(self):
-        """Évalue la structure des pions."""
-        score = 0
-        
-        # Compte les pions par colonne pour détecter les pions doublés/isolés
-        white_pawn_files = {}
-        black_pawn_files = {}
-        
-        for square in self.board.pieces(PAWN, WHITE):
-            file = square % 8
-            white_pawn_files[file] = white_pawn_files.get(file, 0) + 1
-            
-        for square in self.board.pieces(PAWN, not WHITE):
-            file = square % 8
-            black_pawn_files[file] = black_pawn_files.get(file, 0) + 1
-        
-        # Malus pour pions doublés
-        for file, count in white_pawn_files.items():
-            if count > 1:
-                score -= 20 * (count - 1)
-        for file, count in black_pawn_files.items():
-            if count > 1:
-                score += 20 * (count - 1)
-        
-        # Malus pour pions isolés (pas de pions alliés sur files adjacentes)
-        for file in white_pawn_files:
-            if (file-1 not in white_pawn_files) and (file+1 not in white_pawn_files):
-                score -= 15
-        for file in black_pawn_files:
-            if (file-1 not in black_pawn_files) and (file+1 not in black_pawn_files):
-                score += 15
-                
+    def _cached_evaluate(self):
+        """evaluate() mémorisée par clé de Zobrist (les transpositions ne sont évaluées qu'une fois)."""
+        key = self._zkey
+        index = key & EVAL_CACHE_MASK
+        if self._eval_keys[index] == key:
+            return self._eval_scores[index]
+        score = self.evaluate()
+        self._eval_keys[index] = key
+        self._eval_scores[index] = score
         return score
 
-    def _evaluate_center_control(self):
-        """Évalue le contrôle des cases centrales."""
-        center_squares = [27, 28, 35, 36]  # d4, e4, d5, e5
-        extended_center = [18, 19, 20, 21, 26, 29, 34, 37, 42, 43, 44, 45]  # Centre étendu
-        
+    def _mobility_score(self):
+        """Mobilité (blancs - noirs) comptée sur les bitboards d'attaque des pièces."""
+        board = self.board
+        pieces = board.occupied & ~board.pawns & ~board.kings
+        mobility = 0
+        for color, sign in ((WHITE, 1), (not WHITE, -1)):
+            own = board.occupied_co[color]
+            count = 0
+            for square in scan_forward(pieces & own):
+                count += popcount(board.attacks_mask(square) & ~own)
+            mobility += sign * count
+        return mobility
+
+    def _is_passed_pawn(self, square, color, enemy_pawns):
+        """Vérifie si un pion est passé (masque précalculé de la zone devant lui)."""
+        return not PASSED_PAWN_MASK[color][square] & enemy_pawns
+
+    def _evaluate_pawn_structure(self, white_pawns, black_pawns):
+        """Évalue la structure des pions (comptage par colonne sur les bitboards)."""
         score = 0
-        
-        # Bonus pour pièces contrôlant le centre
-        for square in center_squares:
-            piece = self.board.piece_at(square)
-            if piece:
-                if self.board.color_at(square) == WHITE:
-                    score += 30
-                else:
-                    score -= 30
-                    
-        for square in extended_center:
-            piece = self.board.piece_at(square)
-            if piece:
-                if self.board.color_at(square) == WHITE:
-                    score += 10
-                else:
-                    score -= 10
-                    
+        for pawns, sign in ((white_pawns, 1), (black_pawns, -1)):
+            for file in range(8):
+                count = popcount(pawns & FILE_BB[file])
+                if not count:
+                    continue
+                # Malus pour pions doublés
+                if count > 1:
+                    score -= sign * 20 * (count - 1)
+                # Malus pour pions isolés (pas de pions alliés sur files adjacentes)
+                if not pawns & ADJACENT_FILES_BB[file]:
+                    score -= sign * 15
         return score
 
+    def _evaluate_center_control(self):
+        """Évalue l'occupation des cases centrales (comptage sur les bitboards)."""
+        white = self.board.occupied_co[WHITE]
+        black = self.board.occupied_co[not WHITE]
+        # Bonus pour pièces occupant le centre, puis le centre étendu
+        return (30 * (popcount(white & CENTER_MASK) - popcount(black & CENTER_MASK))
+                + 10 * (popcount(white & EXTENDED_CENTER_MASK) - popcount(black & EXTENDED_CENTER_MASK)))
+
+    def _is_middlegame(self):
+        """Phase de jeu : matériel blanc (hors roi) supérieur à 2000, tenu à jour par _push/_pop."""
+        return self._white_material > 2000
+
     def _evaluate_king_safety(self):
         """Évalue la sécurité du roi."""
         score = 0
         
-        # Position du roi
-        white_king = self.board.king(WHITE)
-        black_king = self.board.king(not WHITE)
-        
         # En début/milieu de partie, le roi est plus sûr près du bord
-        material = sum(PIECE_VALUES[piece_type] * len(self.board.pieces(piece_type, WHITE)) 
-                      for piece_type in [PAWN, KNIGHT, BISHOP, ROOK, QUEEN])
-        
-        if material > 2000:  # Milieu de partie
+        # (cases des rois cherchées seulement dans ce cas)
+        if self._is_middlegame():
+            white_king = self.board.king(WHITE)
+            black_king = self.board.king(not WHITE)
             # Roi blanc plus sûr en rangée 0-1
             if white_king // 8 <= 1:
                 score += 20
@@ -244,150 +454,429 @@ class TreeIA:
                 
         return score
 
-    def _order_moves(self, moves, maximizing):
-        """Trie les mouvements pour optimiser l'élagage alpha-beta."""
-        move_scores = []
+    def _order_moves(self, moves, ply=0):
+        """Trie un groupe de coups (une étape de _pick_moves ou les parades) pour l'élagage alpha-beta."""
+        scores = []
+        board = self.board
+        # Liaisons locales : évite les résolutions d'attributs dans la boucle chaude
+        gives_check = board.gives_check
+        check_squares, discovery_mask = self._check_squares()
+        piece_type_at = board.piece_type_at
+        is_en_passant = board.is_en_passant
+        history = self.history
+        slot = 2 * ply
+        killer0 = self.killers[slot]
+        killer1 = self.killers[slot + 1]
+        # Une seule fois pour tous les coups du nœud ; la case de prise en passant est
+        # vide, elle n'est une capture que pour un pion (testée à part)
+        capture_mask = board.occupied_co[not board.turn]
+        ep_square = board.ep_square
         
         for move in moves:
+            from_square = move.from_square
+            to_square = move.to_square
+            move_key = from_square * 64 + to_square
+            piece_type = piece_type_at(from_square)
             score = 0
             
-            # 1) Captures en premier
-            if self.board.is_capture(move):
-                captured_piece = self.board.piece_at(move.to_square)
-                if captured_piece:
-                    score += PIECE_VALUES.get(captured_piece.piece_type, 0) * 10
+            # 1) Captures en premier, par MVV-LVA (victime la plus forte, attaquant le plus faible)
+            if BB_SQUARES[to_square] & capture_mask or (to_square == ep_square and is_en_passant(move)):
+                captured_type = piece_type_at(to_square) or PAWN  # None pour la prise en passant
+                score += PIECE_VALUES[captured_type] * 10
+                # Une prise légale du roi ne peut pas être reprise : attaquant gratuit
+                if piece_type != KING:
+                    score -= PIECE_VALUES[piece_type]
             
-            # 2) Checks
-            self.board.push(move)
-            if self.board.is_check():
+            # 2) Checks : case d'arrivée dans les cases d'échec de la pièce ; gives_check
+            # (qui joue le coup) seulement pour les échecs à la découverte, prises en
+            # passant, promotions et roques
+            if (BB_SQUARES[from_square] & discovery_mask or move.promotion or to_square == ep_square
+                    or (piece_type == KING and abs(to_square - from_square) == 2)):
+                if gives_check(move):
+                    score += 50
+            elif BB_SQUARES[to_square] & check_squares[piece_type]:
                 score += 50
-            self.board.pop()
             
             # 3) Promotions
             if move.promotion:
                 score += 900  # Valeur de la reine
+
+            # 4) Coups tranquilles : killers puis historique
+            if move_key == killer0:
+                score += 600
+            elif move_key == killer1:
+                score += 500
+            history_score = history[move_key]
+            score += history_score if history_score < 400 else 400
                 
-            move_scores.append((score, move))
+            scores.append(score)
         
-        # Tri par score décroissant
-        move_scores.sort(key=lambda x: x[0], reverse=True)
-        return [move for score, move in move_scores]
-
-    def _should_extend_search(self):
-        """Détermine si la recherche doit être étendue pour cette position."""
-        # Extension uniquement pour les checks (plus sûr)
-        if self.board.is_check():
-            return True
-        return False
+        # Tri des indices par score décroissant (clé en C, sans lambda ni tuples)
+        order = sorted(range(len(moves)), key=scores.__getitem__, reverse=True)
+        return [moves[i] for i in order]
 
-    def minimax(self, depth, alpha, beta, maximizing_player):
-        if depth == 0 or self.board.is_game_over():
-            return self.evaluate() + random.uniform(-0.1, 0.1), None
-
-        if maximizing_player:
-            max_eval = -10**9
-            best_move = None
-            for move in self.board.legal_moves:
-                self.board.push(move)
-                # Évaluer la réponse optimale de l'adversaire
-                eval_adversary, _ = self.minimax(depth - 1, alpha, beta, False)
-                # L'IA veut minimiser l'avantage de l'adversaire
-                if eval_adversary > max_eval:
-                    max_eval = eval_adversary
-                    best_move = move
-                self.board.pop()
-                alpha = max(alpha, max_eval)
-                if beta <= alpha:
-                    break
-            return max_eval, best_move
+    def _pick_moves(self, moves, ply=0, tt_move=None):
+        """Fournit les coups par étapes : coup de la table, bonnes captures, coups tranquilles, mauvaises captures."""
+        # 1) Coup de la mémoire transposition, sans rien trier s'il provoque une coupure
+        if tt_move is not None and tt_move in moves:
+            yield tt_move
         else:
-            min_eval = 10**9
-            best_move = None
-            for move in self.board.legal_moves:
-                self.board.push(move)
-                eval_adversary, _ = self.minimax(depth - 1, alpha, beta, True)
-                if eval_adversary < min_eval:
-                    min_eval = eval_adversary
-                    best_move = move
-                self.board.pop()
-                beta = min(beta, min_eval)
-                if beta <= alpha:
+            tt_move = None
+
+        # Répartition des coups restants (reprise seulement si aucune coupure n'a eu lieu)
+        board = self.board
+        capture_mask = board.occupied_co[not board.turn]
+        ep_square = board.ep_square
+        captures = []
+        losing_captures = []
+        quiets = []
+        for move in moves:
+            if move == tt_move:
+                continue
+            to_square = move.to_square
+            if BB_SQUARES[to_square] & capture_mask or (to_square == ep_square and board.is_en_passant(move)):
+                if self._see(move) < 0:
+                    losing_captures.append(move)
+                else:
+                    captures.append(move)
+            elif move.promotion:
+                captures.append(move)
+            else:
+                quiets.append(move)
+
+        # 2) Captures gagnantes ou égales et promotions, 3) coups tranquilles (killers,
+        # historique), 4) captures perdantes ; chaque étape n'est triée qu'une fois atteinte
+        yield from self._order_moves(captures, ply)
+        yield from self._order_moves(quiets, ply)
+        yield from self._order_moves(losing_captures, ply)
+
+    def _store_killer(self, move, ply):
+        """Mémorise un coup tranquille ayant provoqué une coupure à ce ply."""
+        slot = 2 * ply
+        move_key = move.from_square * 64 + move.to_square
+        if move_key == self.killers[slot]:
+            return
+        self.killers[slot + 1] = self.killers[slot]
+        self.killers[slot] = move_key
+
+    def _age_history(self):
+        """Divise l'historique par deux pour favoriser les coupures récentes."""
+        self.history = array('q', [score >> 1 for score in self.history])
+
+    def _check_squares(self):
+        """Cases d'où chaque type de pièce du camp au trait ferait échec, et ses pièces pouvant en découvrir un."""
+        board = self.board
+        us = board.occupied_co[board.turn]
+        occupied = board.occupied
+        king = board.king(not board.turn)
+        diagonal = BB_DIAG_ATTACKS[king][BB_DIAG_MASKS[king] & occupied]
+        straight = (BB_RANK_ATTACKS[king][BB_RANK_MASKS[king] & occupied]
+                    | BB_FILE_ATTACKS[king][BB_FILE_MASKS[king] & occupied])
+        # Indexé par type de pièce ; un pion attaque le roi depuis les cases que le roi
+        # attaquerait s'il était un pion adverse, le roi ne fait jamais échec lui-même
+        check_squares = (0, BB_PAWN_ATTACKS[not board.turn][king], BB_KNIGHT_ATTACKS[king],
+                         diagonal, straight, diagonal | straight, 0)
+        # Échec à la découverte : seule pièce entre une de nos pièces à longue portée et le roi
+        snipers = us & ((BB_DIAG_ATTACKS[king][0] & (board.bishops | board.queens))
+                        | ((BB_RANK_ATTACKS[king][0] | BB_FILE_ATTACKS[king][0]) & (board.rooks | board.queens)))
+        discovery_mask = 0
+        for sniper in scan_forward(snipers):
+            blockers = between(king, sniper) & occupied
+            if blockers & us and not blockers & (blockers - 1):
+                discovery_mask |= blockers
+        return check_squares, discovery_mask
+
+    def _capture_moves(self):
+        """Génère uniquement les captures légales (pièces adverses, puis prise en passant)."""
+        board = self.board
+        # La case de prise en passant est vide : seule la génération dédiée la rejoint,
+        # sinon toute pièce s'y rendant serait prise pour une capture
+        captures = list(board.generate_legal_moves(BB_ALL, board.occupied_co[not board.turn]))
+        captures.extend(board.generate_legal_ep())
+        return captures
+
+    def _see(self, move):
+        """Static Exchange Evaluation : gain matériel de la série d'échanges sur la case d'arrivée."""
+        board = self.board
+        to_square = move.to_square
+        victim = board.piece_type_at(to_square)
+        occupied = board.occupied ^ BB_SQUARES[move.from_square]
+        if victim is None:
+            if not board.is_en_passant(move):
+                return 0  # Coup tranquille : aucun matériel en jeu
+            # Prise en passant : le pion pris disparaît de sa case, derrière la case d'arrivée
+            victim = PAWN
+            occupied ^= BB_SQUARES[to_square - 8 if board.turn == WHITE else to_square + 8]
+        gains = [PIECE_VALUES[victim]]
+        piece_value = PIECE_VALUES[board.piece_type_at(move.from_square)]
+        color = not board.turn
+        while True:
+            # _attackers_mask tient compte des pièces déjà retirées (rayons X)
+            attackers = board._attackers_mask(color, to_square, occupied) & occupied
+            if not attackers:
+                break
+            # Reprise avec la pièce la moins précieuse
+            for piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING):
+                bb = attackers & board.pieces_mask(piece_type, color)
+                if bb:
                     break
-            return min_eval, best_move
-        # Vérifier la mémoire transposition avec clé unique par IA
-        board_key = (self.board.fen(), depth, maximizing, id(self))
-        if board_key in self.transposition_table:
-            cached_score, cached_move = self.transposition_table[board_key]
-            return cached_score, cached_move
-            
-        # Extension de recherche pour les positions critiques
-        if depth == 0 and self._should_extend_search():
+            gains.append(piece_value - gains[-1])
+            piece_value = PIECE_VALUES[piece_type]
+            occupied ^= bb & -bb
+            color = not color
+        # Chaque camp peut s'arrêter d'échanger s'il y perd
+        for i in range(len(gains) - 1, 0, -1):
+            gains[i - 1] = -max(-gains[i - 1], gains[i])
+        return gains[0]
+
+    def quiescence(self, alpha, beta):
+        """Prolonge la recherche sur les captures jusqu'à une position calme."""
+        board = self.board
+        if board.is_check():
+            # En échec, la position n'est pas calme : toutes les parades sont examinées
+            # (dans la limite de MAX_DEPTH, contre les suites d'échecs sans fin)
+            ply = len(self._undo_stack)
+            if ply < MAX_DEPTH:
+                return self._quiescence_evasions(alpha, beta, ply)
+            if not any(board.generate_legal_moves()):
+                return -100000
+        sign = 1 if board.turn == WHITE else -1
+        stand_pat = sign * self._cached_evaluate()
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        # Élagage delta : une capture qui ne peut pas ramener le score à alpha est ignorée
+        delta_floor = alpha - stand_pat - DELTA_MARGIN
+
+        # Captures gagnantes ou égales selon le SEE, triées par victime puis par gain
+        # (clé entière unique par capture : pas de tuples ni de lambda pour le tri)
+        captures = []
+        keys = []
+        for move in self._capture_moves():
+            victim = board.piece_type_at(move.to_square) or PAWN  # None pour la prise en passant
+            victim_value = PIECE_VALUES[victim]
+            if victim_value < delta_floor and not move.promotion:
+                continue
+            see = self._see(move)
+            if see < 0:
+                continue
+            captures.append(move)
+            keys.append(victim_value * 65536 + see)  # 0 <= see < 65536
+
+        best_score = stand_pat
+        for i in sorted(range(len(captures)), key=keys.__getitem__, reverse=True):
+            move = captures[i]
+            self._push(move)
+            score = -self.quiescence(-beta, -alpha)
+            self._pop()
+            if score > best_score:
+                best_score = score
+            if score >= beta:
+                break
+            if score > alpha:
+                alpha = score
+        return best_score
+
+    def _quiescence_evasions(self, alpha, beta, ply):
+        """Quiescence en échec : pas de score statique, chaque parade est prolongée."""
+        moves = list(self.board.generate_legal_moves())
+        if not moves:
+            return -100000  # Mat
+        best_score = -100000
+        for move in self._order_moves(moves, ply):
+            self._push(move)
+            score = -self.quiescence(-beta, -alpha)
+            self._pop()
+            if score > best_score:
+                best_score = score
+            if score >= beta:
+                break
+            if score > alpha:
+                alpha = score
+        return best_score
+
+    def _is_game_over(self):
+        """Comme Board.is_game_over(), sans la répétition (traitée à part dans negamax)."""
+        board = self.board
+        return (board.is_insufficient_material() or board.is_seventyfive_moves()
+                or not any(board.generate_legal_moves()))
+
+    def negamax(self, depth, alpha, beta, ply=0):
+        """Recherche alpha-beta (negamax + PVS), score du point de vue du camp au trait."""
+        board = self.board
+        alpha_orig = alpha
+
+        # Répétition = nulle ; impossible avec moins de 4 demi-coups réversibles
+        if ply > 0 and board.halfmove_clock >= 4 and self._is_repetition():
+            return 0, None
+
+        # Vérifier la mémoire transposition
+        board_key = self._zkey
+        table = self.transposition_table
+        index = (board_key & TT_MASK) << 1
+        data = table[index + 1]
+        tt_move = None
+        if table[index] ^ data == board_key:
+            tt_move = _tt_move(data & 0xFFFF)
+            if data >> 24 & 0xFF >= depth:
+                tt_flag = data >> 16 & 0xFF
+                tt_score = (data >> 32) - TT_SCORE_OFFSET
+                if tt_flag == TT_EXACT:
+                    return tt_score, tt_move
+                if tt_flag == TT_LOWER:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if alpha >= beta:
+                    return tt_score, tt_move
+
+        # Échec calculé une seule fois par nœud (extension et fin de partie)
+        in_check = board.is_check()
+
+        # Extension de recherche pour les positions critiques (uniquement les échecs, plus sûr)
+        if depth == 0 and in_check:
             depth = 1
-            
-        if depth == 0 or self.board.is_game_over():
-            return self.evaluate(), None
 
+        if depth == 0:
+            # Feuille hors échec : une fin de partie ne peut être qu'une nulle
+            if self._is_game_over():
+                return 0, None
+            return self.quiescence(alpha, beta), None
+
+        # Processus auxiliaire : abandon dès que le processus principal a terminé
+        if self.stop_flag is not None and self.stop_flag[0]:
+            raise _SearchStopped
+
+        # Nœud intérieur : coups légaux générés une seule fois (fin de partie + tri)
+        if ply == 0 and self.root_moves is not None:
+            moves = self.root_moves
+        else:
+            moves = list(board.generate_legal_moves())
+            if ply == 0:
+                # Variété du jeu : un seul tirage aléatoire par recherche (ordre des coups
+                # racine, conservé entre coups de même priorité par le tri stable)
+                random.shuffle(moves)
+        if not moves:
+            # Mat ou pat, connu sans réévaluer la position
+            return -100000 if in_check else 0, None
+        if board.is_insufficient_material() or board.is_seventyfive_moves():
+            return 0, None
+
+        best_score = -INF
         best_move = None
-        
-        # Tri des mouvements pour optimiser l'élagage alpha-beta
-        moves = self._order_moves(self.board.legal_moves, maximizing)
-        if maximizing:
-            max_eval = -10**9
-            for move in moves:
-                self.board.push(move)
-                eval_score, _ = self.minimax(depth - 1, alpha, beta, False)
-                self.board.pop()
-                if eval_score > max_eval:
-                    max_eval = eval_score
-                    best_move = move
-                if eval_score > alpha:
-                    alpha = eval_score
-                if beta <= alpha:
-                    break
-            # Stocker dans la mémoire transposition avec clé unique par IA
-            self.transposition_table[board_key] = (max_eval, best_move)
-            return max_eval, best_move
+        for i, move in enumerate(self._pick_moves(moves, ply, tt_move)):
+            self._push(move)
+            if i == 0:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)[0]
+            else:
+                # PVS : fenêtre nulle, puis recherche complète si le coup bat alpha
+                score = -self.negamax(depth - 1, -alpha - 1, -alpha, ply + 1)[0]
+                if alpha < score < beta:
+                    score = -self.negamax(depth - 1, -beta, -score, ply + 1)[0]
+            self._pop()
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not board.is_capture(move):
+                    self._store_killer(move, ply)
+                    self.history[move.from_square * 64 + move.to_square] += depth * depth
+                break
+
+        # Stocker dans la mémoire transposition avec le type de borne
+        if best_score <= alpha_orig:
+            flag = TT_UPPER
+        elif best_score >= beta:
+            flag = TT_LOWER
         else:
-            min_eval = 10**9
-            for move in moves:
-                self.board.push(move)
-                eval_score, _ = self.minimax(depth - 1, alpha, beta, True)
-                self.board.pop()
-                if eval_score < min_eval:
-                    min_eval = eval_score
-                    best_move = move
-                if eval_score < beta:
-                    beta = eval_score
-                if beta <= alpha:
+            flag = TT_EXACT
+        old = table[index + 1]
+        # Remplacement systématique, sauf une entrée exacte plus profonde d'une autre position
+        if table[index] ^ old == board_key or old >> 24 & 0xFF <= depth or old >> 16 & 0xFF != TT_EXACT:
+            data = _tt_pack(depth, flag, best_score, best_move)
+            table[index] = board_key ^ data
+            table[index + 1] = data
+        return best_score, best_move
+
+    def iterative_deepening(self, max_depth):
+        """Approfondissement itératif avec fenêtres d'aspiration autour du score précédent."""
+        if self.transposition_table is None:
+            self.transposition_table = array('Q', bytes(TT_BYTES))
+        self._init_incremental()
+        score, best_move = None, None
+        for depth in range(1, max_depth + 1):
+            delta = ASPIRATION_WINDOW
+            if score is None:
+                alpha, beta = -INF, INF
+            else:
+                alpha, beta = score - delta, score + delta
+            fail_count = 0
+            while True:
+                value, move = self.negamax(depth, alpha, beta)
+                if alpha < value < beta or (alpha <= -INF and beta >= INF):
                     break
-            # Stocker dans la mémoire transposition avec clé unique par IA
-            self.transposition_table[board_key] = (min_eval, best_move)
-            return min_eval, best_move
+                # Échec bas/haut : seule la borne dépassée s'élargit, d'un delta doublé
+                # à chaque échec, puis la fenêtre est ouverte après deux échecs
+                fail_count += 1
+                delta *= 2
+                if fail_count >= 2:
+                    alpha, beta = -INF, INF
+                elif value <= alpha:
+                    alpha = max(value - delta, -INF)
+                else:
+                    beta = min(value + delta, INF)
+            score = value
+            if move is not None:
+                best_move = move
+        return score, best_move
+
+    def parallel_search(self, max_depth):
+        """Lazy SMP : tous les processus cherchent la position en partageant la mémoire transposition."""
+        if self._pool is None:
+            # Mémoire transposition suivie d'un octet servant de drapeau d'arrêt
+            self._shared_table = SharedMemory(create=True, size=TT_BYTES + 1)
+            self._pool = Pool(self.workers)
+            # Le finaliseur ne garde pas de référence à l'IA elle-même
+            self._finalizer = weakref.finalize(self, _release_parallel, self._pool, self._shared_table)
+        table_name = self._shared_table.name
+        self._shared_table.buf[TT_BYTES] = 0
+        # Le processus principal est soumis en premier ; les auxiliaires ne servent
+        # qu'à remplir la table
+        main = self._pool.apply_async(_lazy_smp_worker, (self.board, max_depth, table_name, 0))
+        helpers = [self._pool.apply_async(_lazy_smp_worker, (self.board, max_depth, table_name, worker_id))
+                   for worker_id in range(1, self.workers)]
+        try:
+            return main.get()
+        finally:
+            # Arrêt des auxiliaires, attendu pour que le coup suivant trouve le pool libre
+            self._shared_table.buf[TT_BYTES] = 1
+            for helper in helpers:
+                helper.wait()
+
+    def close(self):
+        """Libère le pool de processus et la mémoire partagée de la recherche parallèle."""
+        if self._pool is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._pool = None
+            self._shared_table = None
 
     def get_opening_move(self, board):
         """Retourne un coup d'ouverture si disponible dans le livre."""
-        current_fen = board.fen()
-        
-        # Vérifier si la position actuelle est dans notre livre
-        if current_fen in OPENING_BOOK:
-            opening_moves = OPENING_BOOK[current_fen]
-            
-            # Choisir aléatoirement parmi les meilleures ouvertures
-            # pour plus de variété et imprévisibilité
-            chosen_move = random.choice(opening_moves)
-            
-            # Vérifier que le coup est légal
-            try:
-                move = board.push_san(chosen_move)
-                board.pop()  # Annuler le coup pour ne pas modifier le board
-                return board.san(move)
-            except ValueError:
-                # Si le coup n'est pas valide, passer au calcul normal
-                return None
-        
-        return None
+        # Vérifier si la position actuelle est dans notre livre (clé de Zobrist, sans FEN)
+        opening_moves = _OPENING_BOOK_MOVES.get(zobrist_hash(board))
+        if not opening_moves:
+            return None
+        # Choisir aléatoirement parmi les meilleures ouvertures
+        # pour plus de variété et imprévisibilité
+        return random.choice(opening_moves)
 
-    def coup(self, board) -> str:
+    def coup(self, board) -> Move:
+        """Retourne le coup choisi pour `board` (objet Move, à jouer avec board.push)."""
         # Utiliser la bibliothèque d'ouvertures pour les 10 premiers coups
         if self.opening_moves_played < 10:
             opening_move = self.get_opening_move(board)
@@ -400,8 +889,34 @@ class TreeIA:
         
         # Calcul normal avec l'IA
         self.board = board  # Utiliser le board actuel du jeu
-        maximizing = self.board.turn == WHITE
-        _, move = self.minimax(self.depth, -10**9, 10**9, maximizing)
+        self._age_history()
+        if self.workers > 1:
+            _, move = self.parallel_search(self.depth)
+        else:
+            _, move = self.iterative_deepening(self.depth)
         if move is None:
             raise ValueError("Aucun coup trouvé")
-        return self.board.san(move)
+        return move
+
+
+def _lazy_smp_worker(board, depth, table_name, worker_id):
+    """Tâche d'un processus de la recherche parallèle, sur la mémoire transposition partagée."""
+    shared_table = SharedMemory(name=table_name)
+    ia = TreeIA(depth)
+    ia.board = board
+    ia.transposition_table = shared_table.buf[:TT_BYTES].cast('Q')
+    ia.stop_flag = shared_table.buf[TT_BYTES:]
+    try:
+        if worker_id:
+            # Auxiliaires : ordre des coups racine mélangé et profondeur décalée d'un
+            # processus sur deux, pour explorer des branches différentes du principal
+            ia.root_moves = list(board.legal_moves)
+            random.Random(worker_id).shuffle(ia.root_moves)
+            depth += worker_id & 1
+        return ia.iterative_deepening(depth)
+    except _SearchStopped:
+        return None  # Auxiliaire arrêté : son travail est déjà dans la table partagée
+    finally:
+        ia.transposition_table.release()
+        ia.stop_flag.release()
+        shared_table.close()
@@ -110,7 +110,9 @@ class Chess_UI:
         self.bg_photo = ImageTk.PhotoImage(self.bg_img)
         self.canvas.create_image(board_width / 2, board_height / 2, image=self.bg_photo)
         
-        self.pieces_list = []
+        # Éléments du canevas par case (indice row * 8 + col) et symbole de la pièce affichée
+        self.square_items = {}
+        self.square_pieces = {}
 
         # Contrôleur pour les interactions humaines (clics)
         self.human_controller = HumanController(
@@ -150,20 +152,24 @@ class Chess_UI:
     
     def display_piece(self, piece:Piece, col:int, row:int) -> None:
         """
-        Affiche une pièce
+        Affiche une pièce, en réutilisant l'élément du canevas de la case s'il existe
         """
-        self.pieces_list.append(self.canvas.create_image(self.get_x_from_col(col), self.get_y_from_row(row), image=self.img_dict[piece]))
+        square = row * 8 + col
+        item = self.square_items.get(square)
+        if item is None:
+            self.square_items[square] = self.canvas.create_image(self.get_x_from_col(col), self.get_y_from_row(row), image=self.img_dict[piece])
+        else:
+            self.canvas.itemconfigure(item, image=self.img_dict[piece])
+        self.square_pieces[square] = piece
 
     def update_board(self):
         """
         Mise à jour du plateau
         """
-        #Suppression des pièces afin de les remettre à jour
-        for piece in self.pieces_list:
-            self.canvas.delete(piece)   
         row = 0
         col = 0
-        #Replacement des pièces
+        #Lecture des pièces de la position courante
+        current_pieces = {}
         for piece in self.board.board_fen():
             if '1' <= piece <= '8':
                 col += ord(piece) - ord('0')
@@ -171,14 +177,28 @@ class Chess_UI:
                 col = 0
                 row += 1
             else:
-                self.display_piece(piece, col, row)
+                current_pieces[row * 8 + col] = piece
                 col += 1
 
-        #Mise à jour de l'historique
-        if self.board.turn == WHITE:
-            self.history_white_listbox.update()
-        else:
-            self.history_black_listbox.update()
+        #Suppression des pièces des cases devenues vides
+        for square in [square for square in self.square_pieces if square not in current_pieces]:
+            self.canvas.delete(self.square_items.pop(square))
+            del self.square_pieces[square]
+        #Mise à jour des seules cases modifiées
+        for square, piece in current_pieces.items():
+            if self.square_pieces.get(square) != piece:
+                self.display_piece(piece, square % 8, square // 8)
+
+        #Mise à jour de l'historique : seul le dernier coup est converti en SAN, sur le plateau
+        #lui-même (sans copie) ; les listes se rafraîchissent via leur StringVar
+        if len(self.history_white) + len(self.history_black) < len(self.board.move_stack):
+            last_move = self.board.pop()
+            move_san = self.board.san(last_move)
+            self.board.push(last_move)
+            if self.board.turn == WHITE:
+                self.update_history_black(move_san)
+            else:
+                self.update_history_white(move_san)
 
         # Si ce n'est pas à un humain de jouer, on laisse le contrôleur planifier le tour IA.
         self.human_controller.maybe_schedule_ai_turn(self.jouer)
@@ -216,12 +236,12 @@ class Chess_UI:
             if self.human_white:
                 # C'est un humain : Chess_UI ne joue pas, HumanController s'en charge
                 return
-            self.board.push_san(self.Joueur_Blanc.coup(self.board))
+            self.board.push(self.Joueur_Blanc.coup(self.board))
         else:
             # Tour des noirs
             if self.human_black:
                 # C'est un humain : Chess_UI ne joue pas, HumanController s'en charge
                 return
-            self.board.push_san(self.Joueur_Noir.coup(self.board))
+            self.board.push(self.Joueur_Noir.coup(self.board))
             
         self.update_board() #Mise à jour de l'échiquier
@@ -8,17 +8,20 @@ from ia_tree import TreeIA
 Décommentez les imports pour y mettre votre fichier d'IA
 """
 
-board = Board()
-root = Tk()
-root.title("Echecs")
+# Garde indispensable pour TreeIA(workers>1) : avec la méthode "spawn" (Windows, macOS),
+# chaque processus de la recherche parallèle réimporte ce fichier et ouvrirait sa fenêtre
+if __name__ == "__main__":
+    board = Board()
+    root = Tk()
+    root.title("Echecs")
 
-"""
-Rajoutez le nom de votre fichier pour jouer à votre Jeu et en entrée de la fonction classe Chess_UI
-"""
+    """
+    Rajoutez le nom de votre fichier pour jouer à votre Jeu et en entrée de la fonction classe Chess_UI
+    """
 
-ia_blanc = None              # Humain joue les blancs
-ia_noir = TreeIA(depth=4)  # IA joue les noirs
+    ia_blanc = None              # Humain joue les blancs
+    ia_noir = TreeIA(depth=4)  # IA joue les noirs
 
-c = Chess_UI(root, board, ia_blanc, ia_noir)
+    c = Chess_UI(root, board, ia_blanc, ia_noir)
 
-root.mainloop()
+    root.mainloop()
@@ -0,0 +1,129 @@
+"""
+Vérifications des invariants de TreeIA (exécutables avec pytest ou directement :
+python test_ia_tree.py)
+"""
+import random
+
+from chess import Board, Move, BB_SQUARES, KING
+from chess.polyglot import zobrist_hash
+
+from ia_tree import TreeIA
+
+# Positions de départ variées : roques, prise en passant, promotions
+POSITIONS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+    "n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1",
+    "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+]
+
+# (position, coup, SEE attendu)
+SEE_CASES = [
+    ("4k3/8/8/3p4/8/8/8/3RK3 w - - 0 1", "d1d5", 100),       # Pion non défendu
+    ("4k3/8/2p5/3p4/8/8/8/3RK3 w - - 0 1", "d1d5", -400),     # Tour contre pion défendu
+    ("4k3/8/2p5/3n4/4P3/8/8/4K3 w - - 0 1", "e4d5", 220),     # Pion prend cavalier défendu
+    ("3rk3/8/8/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5", 100),     # Tours doublées (rayons X)
+    ("4k3/8/8/8/8/8/8/3RK3 w - - 0 1", "d1d5", 0),            # Coup tranquille
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6", 100),       # Prise en passant
+    ("4k3/2p5/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6", 0),       # Prise en passant reprise
+    ("4k3/3q4/8/3pP3/8/8/8/3RK3 w - d6 0 1", "e5d6", 100),    # Pion pris hors de la colonne d
+    ("rnbqkbnr/1ppp1ppp/p7/4p1N1/8/8/PPPPPPPP/RNBQKB1R w KQkq e6 0 3", "g5e6", 0),  # Case e6 vide
+]
+
+
+def _random_walk(ia, plies, rng):
+    """Joue des coups aléatoires avec _push, en revenant souvent en arrière pour créer des répétitions."""
+    board = ia.board
+    for _ in range(plies):
+        moves = list(board.legal_moves)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        if len(board.move_stack) >= 2 and rng.random() < 0.5:
+            # Coup inverse de notre coup précédent, s'il est légal
+            previous = board.move_stack[-2]
+            back = Move(previous.to_square, previous.from_square)
+            if back in moves:
+                move = back
+        ia._push(move)
+        yield move
+
+
+def test_incremental_zobrist():
+    """La clé incrémentale de _push/_pop correspond à chess.polyglot.zobrist_hash."""
+    rng = random.Random(1)
+    for fen in POSITIONS:
+        for _ in range(20):
+            ia = TreeIA()
+            ia.board = Board(fen)
+            ia._init_incremental()
+            keys = [ia._zkey]
+            for _ in _random_walk(ia, 40, rng):
+                assert ia._zkey == zobrist_hash(ia.board), ia.board.fen()
+                keys.append(ia._zkey)
+            # Retour arrière : chaque clé est restaurée
+            while ia._undo_stack:
+                keys.pop()
+                ia._pop()
+                assert ia._zkey == keys[-1] == zobrist_hash(ia.board), ia.board.fen()
+
+
+def test_repetition():
+    """_is_repetition donne le même résultat que board.is_repetition(2)."""
+    rng = random.Random(2)
+    repetitions = 0
+    for fen in POSITIONS:
+        for _ in range(20):
+            ia = TreeIA()
+            ia.board = Board(fen)
+            ia._init_incremental()
+            for _ in _random_walk(ia, 40, rng):
+                expected = ia.board.is_repetition(2)
+                assert ia._is_repetition() == expected, ia.board.fen()
+                repetitions += expected
+            # Historique de partie repris par _init_incremental
+            ia._init_incremental()
+            assert ia._is_repetition() == ia.board.is_repetition(2), ia.board.fen()
+    assert repetitions  # Le parcours doit bien produire des répétitions
+
+
+def test_check_squares():
+    """Le test statique d'échec de _order_moves donne le même résultat que board.gives_check."""
+    rng = random.Random(3)
+    for fen in POSITIONS:
+        for _ in range(50):
+            ia = TreeIA()
+            ia.board = Board(fen)
+            ia._init_incremental()
+            for _ in _random_walk(ia, rng.randrange(30), rng):
+                pass
+            board = ia.board
+            check_squares, discovery_mask = ia._check_squares()
+            for move in board.legal_moves:
+                piece_type = board.piece_type_at(move.from_square)
+                # Cas laissés à gives_check par _order_moves
+                if (BB_SQUARES[move.from_square] & discovery_mask or move.promotion
+                        or move.to_square == board.ep_square
+                        or (piece_type == KING and abs(move.to_square - move.from_square) == 2)):
+                    continue
+                static = bool(BB_SQUARES[move.to_square] & check_squares[piece_type])
+                assert static == board.gives_check(move), (board.fen(), move.uci())
+
+
+def test_see():
+    """Valeurs du SEE sur des échanges connus (dont prise en passant et coup tranquille)."""
+    ia = TreeIA()
+    for fen, uci, expected in SEE_CASES:
+        ia.board = Board(fen)
+        assert ia._see(Move.from_uci(uci)) == expected, (fen, uci)
+
+
+if __name__ == "__main__":
+    test_incremental_zobrist()
+    test_repetition()
+    test_check_squares()
+    test_see()
+    print("ok")